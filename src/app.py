@@ -20,12 +20,21 @@ from __future__ import annotations
 import os
 import re
 import math
+import functools
 import shutil
+import signal
+import stat
 import sys
 import locale
 import gettext
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, TypeVar
 
 import gi
 gi.require_version("Gtk", "4.0")
@@ -42,6 +51,7 @@ except Exception:
 APP_ID = "io.github.shonubot.Spruce"
 IS_FLATPAK = Path("/.flatpak-info").exists()
 SPRUCE_DEBUG = os.environ.get("SPRUCE_DEBUG") == "1"
+HOME = Path.home()  # fixed for the life of the process
 VERSION = "0.2.1" # DONT FORGET TO UPDATE
 
 # Initialize translations
@@ -58,327 +68,401 @@ try:
 except Exception:
     _ = lambda s: s
 
+@functools.lru_cache(maxsize=1)
 def _find_ui() -> str:
     override = os.environ.get("SPRUCE_UI_PATH")
-    if override and Path(override).is_file():
+    if override and os.path.isfile(override):
         return override
 
-    here = Path(__file__).resolve()
+    # Plain string paths: no Path objects and no realpath() walk over every component
+    here = os.path.dirname(os.path.abspath(__file__))
 
     candidates = [
-        Path("/app/share/spruce/ui/window.ui"),
-        Path("/usr/share/spruce/ui/window.ui"),
-        Path("/usr/local/share/spruce/ui/window.ui"),
-        here.parent.parent.parent / "ui" / "window.ui",
-        here.parent.parent / "ui" / "window.ui",
-        Path.cwd() / "ui" / "window.ui",
+        "/app/share/spruce/ui/window.ui",
+        "/usr/share/spruce/ui/window.ui",
+        "/usr/local/share/spruce/ui/window.ui",
+        os.path.join(here, os.pardir, os.pardir, "ui", "window.ui"),
+        os.path.join(here, os.pardir, "ui", "window.ui"),
+        os.path.join(os.getcwd(), "ui", "window.ui"),
     ]
 
     for p in candidates:
+        if os.path.isfile(p):
+            return os.path.normpath(p)
+
+    return "/usr/share/spruce/ui/window.ui"
+
+_SIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
+
+def human_size(n: int) -> str:
+    if n < 1024:
+        return f"{n:.0f}B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    mag = min((int(n).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{n / (1 << (10 * mag)):.1f}{_SIZE_UNITS[mag]}"
+
+# dir_size() memo: path -> (size, (dir, mtime_ns) for every directory in the tree, computed_at),
+# bounded LRU. Creating, removing or renaming anything bumps the mtime of the directory that
+# holds it, so a hit re-stats those directories instead of listing the whole tree again.
+# A file rewritten in place touches no directory, which is why entries also age out.
+_SIZE_CACHE: OrderedDict[str, tuple[int, tuple[tuple[str, int], ...], float]] = OrderedDict()
+_SIZE_CACHE_MAX = 4096
+_SIZE_CACHE_MAX_AGE = 300.0
+_SIZE_CACHE_LOCK = threading.Lock()
+
+def _invalidate_size_cache(path: Path | str) -> None:
+    """Forget cached sizes for `path`, anything below it and anything containing it."""
+    s = os.fspath(path)
+    with _SIZE_CACHE_LOCK:
+        for key in [k for k in _SIZE_CACHE
+                    if k == s or k.startswith(s + os.sep) or s.startswith(k + os.sep)]:
+            del _SIZE_CACHE[key]
+
+def _dirs_unchanged(dirs: tuple[tuple[str, int], ...]) -> bool:
+    for d, mtime_ns in dirs:
         try:
-            if p.is_file():
-                return str(p)
+            if os.stat(d, follow_symlinks=False).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+def _scan_dir(path: str) -> tuple[int, list[tuple[str, int]]] | None:
+    """One listing of `path`: (size of its files, [(subdirectory, mtime_ns)]); None if it
+    can't be listed. Each mtime is taken before that subdirectory is itself listed, so a
+    change racing the walk shows up as a mismatch on the next lookup rather than being lost."""
+    files = 0
+    subdirs: list[tuple[str, int]] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                    elif entry.is_file(follow_symlinks=False):
+                        files += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    return files, subdirs
+
+def dir_size(path: Path | str, st: os.stat_result | None = None,
+             cancel: Gio.Cancellable | None = None) -> int:
+    """Sum the sizes of all files below `path` without following symlinks.
+    Pass `st` if the caller already stat'ed `path`. Once `cancel` fires the walk stops
+    early and returns a partial total, which is not memoized."""
+    root = os.fspath(path)
+    try:
+        mtime_ns = (st or os.stat(root)).st_mtime_ns
+    except OSError:
+        return 0
+    now = time.monotonic()
+    with _SIZE_CACHE_LOCK:
+        hit = _SIZE_CACHE.get(root)
+    # Validated outside the lock: it is one stat per directory in the tree
+    if (hit is not None and now - hit[2] < _SIZE_CACHE_MAX_AGE
+            and hit[1][0] == (root, mtime_ns) and _dirs_unchanged(hit[1][1:])):
+        with _SIZE_CACHE_LOCK:
+            if root in _SIZE_CACHE:
+                _SIZE_CACHE.move_to_end(root)
+        return hit[0]
+
+    scanned = _scan_dir(root)
+    if scanned is None:
+        return 0
+    total, subdirs = scanned
+    dirs = [(root, mtime_ns), *subdirs]
+    for sub_total, sub_dirs in _walk_subdirs([d for d, _m in subdirs], cancel):
+        total += sub_total
+        dirs += sub_dirs
+    if cancel is not None and cancel.is_cancelled():
+        return total
+    with _SIZE_CACHE_LOCK:
+        _SIZE_CACHE[root] = (total, tuple(dirs), now)
+        _SIZE_CACHE.move_to_end(root)
+        while len(_SIZE_CACHE) > _SIZE_CACHE_MAX:
+            _SIZE_CACHE.popitem(last=False)
+    return total
+
+# Shared by every dir_size() and _rmtree_parallel() call. Tasks are whole subtree walks or
+# removals that never wait on other tasks, so callers running on other pools can block on it
+# without deadlocking.
+_WALK_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="spruce-walk")
+
+def _walk_subdirs(subdirs: list[str],
+                  cancel: Gio.Cancellable | None = None) -> list[tuple[int, list[tuple[str, int]]]]:
+    """_walk_size() over the top-level subdirectories of a tree, concurrently.
+    Fanning out deeper costs more in task overhead than it wins back on warm caches."""
+    if len(subdirs) == 1:
+        return [_walk_size(subdirs[0], cancel)]
+    return list(_WALK_POOL.map(_walk_size, subdirs, itertools.repeat(cancel)))
+
+def _walk_size(root: str, cancel: Gio.Cancellable | None = None) -> tuple[int, list[tuple[str, int]]]:
+    """(size of the files below `root`, [(directory, mtime_ns)] for every directory below it)."""
+    total = 0
+    dirs: list[tuple[str, int]] = []
+    stack = [root]
+    while stack:
+        # Checked per directory: cheap next to the scandir, and quick enough to stop on
+        if cancel is not None and cancel.is_cancelled():
+            break
+        scanned = _scan_dir(stack.pop())
+        if scanned is None:
+            continue
+        files, subdirs = scanned
+        total += files
+        dirs += subdirs
+        stack.extend(d for d, _m in subdirs)
+    return total, dirs
+
+def path_size(p: Path | str, cancel: Gio.Cancellable | None = None) -> int:
+    """Size of a single cache entry: recursive for directories, plain stat otherwise.
+    Raises OSError if `p` doesn't exist (including dangling symlinks)."""
+    st = os.stat(p)
+    if stat.S_ISDIR(st.st_mode):
+        return dir_size(p, st, cancel)
+    return st.st_size
+
+# Sizing and deleting are syscall bound and release the GIL, so sibling trees are handled in parallel
+_IO_WORKERS = min(8, os.cpu_count() or 4)
+# Kept for the whole session so repeated sweeps don't spin up fresh threads every time. Its
+# tasks only ever wait on _WALK_POOL, never on this pool, so sharing it cannot deadlock.
+_SIZE_POOL = ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="spruce-size")
+
+_P = TypeVar("_P", str, Path)
+
+def _sized_paths(paths: list[_P], cancel: Gio.Cancellable | None = None) -> list[tuple[_P, int]]:
+    """[(path, path_size(path))] computed on a thread pool; unreadable paths are skipped.
+    Paths come back as given, so callers that only need strings never build Path objects.
+    After `cancel` fires, paths that haven't started yet are skipped too."""
+    def one(p: _P) -> tuple[_P, int] | None:
+        if cancel is not None and cancel.is_cancelled():
+            return None
+        try:
+            return p, path_size(p, cancel)
         except Exception:
-            pass
+            return None
 
-    return str(Path("/usr/share/spruce/ui/window.ui"))
+    return [r for r in _SIZE_POOL.map(one, paths) if r is not None]
 
-def human_size(n: int) -> str:
-    units = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
-    f = float(n)
-    for u in units:
-        if f < 1024 or u == units[-1]:
-            return f"{f:.0f}{u}" if u == "B" else f"{f:.1f}{u}"
-        f /= 1024.0
-    return f"{f:.1f}EiB"
+# Same walker as dir_size(), shipped to the host python3 in _HOST_SWEEP_SCRIPT
+_HOST_DIR_SIZE = """
+import os
+import stat
+def dir_size(path):
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    return total
+def path_size(path):
+    st = os.stat(path)
+    return dir_size(path) if stat.S_ISDIR(st.st_mode) else st.st_size
+"""
 
+@functools.lru_cache(maxsize=1)
 def xdg_cache() -> Path:
-    return Path(os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache")))
+    return Path(os.environ.get("XDG_CACHE_HOME", str(HOME / ".cache")))
 
+@functools.lru_cache(maxsize=1)
 def xdg_data() -> Path:
-    return Path(os.environ.get("XDG_DATA_HOME", str(Path.home() / ".local" / "share")))
+    return Path(os.environ.get("XDG_DATA_HOME", str(HOME / ".local" / "share")))
 
+@functools.lru_cache(maxsize=1)
 def trash_dir() -> Path:
     return xdg_data() / "Trash"
 
 # This method sucks for now
 # TODO: Create one method where cache paths can be easily appended.
-def get_trash_size() -> int:
-    trash = trash_dir()
-    files_dir = trash / "files"
-    
-    if not IS_FLATPAK:
-        if not files_dir.exists():
-            return 0
-        total_size = 0
-        try:
-            for item in files_dir.rglob('*'):
-                try:
-                    if item.is_file():
-                        total_size += item.stat().st_size
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        return total_size
-    
-    # To access host on Flatpak
-    script = f"""
-import os, sys
-from pathlib import Path
-trash_files = Path.home() / '.local' / 'share' / 'Trash' / 'files'
-if not trash_files.is_dir():
-    print("0")
-    sys.exit(0)
-total = 0
-try:
-    for item in trash_files.rglob('*'):
-        try:
-            if item.is_file():
-                total += item.stat().st_size
-        except Exception:
-            pass
-except Exception:
-    pass
-print(total)
-"""
-    code, out, _ = _run(_host_exec("python3", "-c", script))
-    if code == 0 and out.strip():
-        try:
-            return int(out.strip())
-        except Exception:
-            pass
-    return 0
+def get_trash_size(cancel: Gio.Cancellable | None = None) -> int:
+    """Outside Flatpak only; _host_sweep_entries() sizes the host trash from the sandbox."""
+    files_dir = trash_dir() / "files"
+    if not files_dir.exists():
+        return 0
+    return dir_size(files_dir, cancel=cancel)
 
 def _host_exec(*argv: str) -> list[str]:
     return ["flatpak-spawn", "--host", *argv] if IS_FLATPAK else list(argv)
 
-def _run(argv: list[str], stdin_text: str | None = None) -> tuple[int, str, str]:
-    """Run a command with Gio.Subprocess and capture stdout/stderr (UTF-8)."""
+def _run(argv: list[str], stdin_text: str | None = None,
+         cancel: Gio.Cancellable | None = None) -> tuple[int, str, str]:
+    """Run a command with Gio.Subprocess and capture stdout/stderr (UTF-8).
+    If `cancel` fires first the child is terminated and this returns code 127."""
     try:
-        flags = Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE
+        # INHERIT_FDS lets GLib use posix_spawn instead of fork+exec. Python and GLib open
+        # everything O_CLOEXEC, so nothing extra actually leaks into the child.
+        flags = (Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE
+                 | Gio.SubprocessFlags.INHERIT_FDS)
         if stdin_text is not None:
             flags |= Gio.SubprocessFlags.STDIN_PIPE
         sp = Gio.Subprocess.new(argv, flags)
-        ok, out, err = sp.communicate_utf8(stdin_text, None)
-        if ok:
-            return 0, out or "", err or ""
-        code = sp.get_exit_status()
+        # communicate_utf8() reports whether the I/O worked (it raises otherwise), not how the
+        # child exited; take the exit status from the process itself
+        try:
+            _ok, out, err = sp.communicate_utf8(stdin_text, cancel)
+        except GLib.Error:
+            # SIGTERM rather than force_exit(): flatpak-spawn passes it on to the host process
+            sp.send_signal(signal.SIGTERM)
+            raise
+        code = sp.get_exit_status() if sp.get_if_exited() else 128 + sp.get_term_sig()
         return code, out or "", err or ""
     except Exception as e:
         return 127, "", str(e)
 
-def _host_list_dirs_with_sizes(base: Path) -> list[tuple[str, int]]:
-    """Enumerate first-level subdirs under `base` on the host and return [(path, size)]."""
-    if not IS_FLATPAK:
-        if not base.exists():
-            return []
-        result = []
-        for child in base.iterdir():
-            try:
-                if not child.exists():
-                    continue
-                size = 0
-                if child.is_dir():
-                    for f in child.rglob('*'):
-                        try:
-                            if f.is_file():
-                                size += f.stat().st_size
-                        except Exception:
-                            pass
-                else:
-                    size = child.stat().st_size
-                result.append((str(child), size))
-            except Exception:
-                pass
-        return sorted(result, key=lambda t: t[1], reverse=True)
+def _host_list_dirs_with_sizes(base: Path,
+                               cancel: Gio.Cancellable | None = None) -> list[tuple[str, int]]:
+    """Enumerate first-level subdirs under `base` and return [(path, size)], unordered.
+    Outside Flatpak only, like the other _host_*_entries helpers below."""
+    try:
+        with os.scandir(base) as it:
+            children = [e.path for e in it]
+    except OSError:
+        return []
+    return _sized_paths(children, cancel)
 
-    # Another script for Flatpak
-    script = f"""
-import os, sys
-from pathlib import Path
-base = Path(os.path.expandvars({repr(str(base))}))
-if not base.is_dir():
-    sys.exit(0)
-for child in base.iterdir():
+
+def _dir_key(p: Path) -> tuple[int, int] | str:
+    """Identity of a directory: (st_dev, st_ino), so bind mounts and symlinks compare equal.
+    Falls back to the path string when it can't be stat'ed from here (host-only paths)."""
     try:
-        if not child.exists():
-            continue
-        size = 0
-        if child.is_dir():
-            for f in child.rglob('*'):
-                try:
-                    if f.is_file():
-                        size += f.stat().st_size
-                except Exception:
-                    pass
-        else:
-            size = child.stat().st_size
-        print(f"{{size}} {{child}}")
-    except Exception:
-        pass
-"""
-    code, out, _ = _run(_host_exec("python3", "-c", script))
-    result = []
-    if code == 0 and out.strip():
-        for ln in out.splitlines():
-            parts = ln.strip().split(None, 1)
-            if len(parts) == 2 and parts[0].isdigit():
-                result.append((parts[1], int(parts[0])))
-    return sorted(result, key=lambda t: t[1], reverse=True)
+        st = os.stat(os.path.realpath(p))
+        return st.st_dev, st.st_ino
+    except OSError:
+        return str(p)
 
+def _unique_dirs(paths: list[Path]) -> list[Path]:
+    seen: set[tuple[int, int] | str] = set()
+    result = []
+    for p in paths:
+        key = _dir_key(p)
+        if key not in seen:
+            seen.add(key)
+            result.append(p)
+    return result
 
-def _host_first_level_cache_entries() -> list[tuple[str, int]]:
-    """Host ~/.cache and $XDG_CACHE_HOME top-level entries."""
-    results = []
-    home = Path.home()
+def _host_cache_roots() -> list[Path]:
+    home = HOME
     roots = [home / ".cache"]
     xdg = os.environ.get("XDG_CACHE_HOME")
     if xdg:
         roots.append(Path(xdg))
+    return _unique_dirs(roots)
+
+def _host_first_level_cache_entries(cancel: Gio.Cancellable | None = None) -> list[tuple[str, int]]:
+    """Host ~/.cache and $XDG_CACHE_HOME top-level entries."""
+    results = []
     seen = set()
-    for root in roots:
-        for path, size in _host_list_dirs_with_sizes(root):
+    for root in _host_cache_roots():
+        if cancel is not None and cancel.is_cancelled():
+            break
+        for path, size in _host_list_dirs_with_sizes(root, cancel):
             if path not in seen:
                 seen.add(path)
                 results.append((path, size))
     return results
 
 
-def _host_app_cache_entries() -> list[tuple[str, int]]:
+def _local_subdirs(base: Path, *parts: str) -> list[str]:
+    """Existing `base/*/parts...` directories, as plain strings."""
+    try:
+        with os.scandir(base) as it:
+            candidates = [os.path.join(e.path, *parts) for e in it]
+    except OSError:
+        return []
+    return [c for c in candidates if os.path.isdir(c)]
+
+def _host_app_cache_entries(cancel: Gio.Cancellable | None = None) -> list[tuple[str, int]]:
     """Host ~/.var/app/*/cache directories."""
-    base = Path.home() / ".var" / "app"
-    if not IS_FLATPAK:
-        results = []
-        if base.exists():
-            for appdir in base.iterdir():
-                cdir = appdir / "cache"
-                if cdir.is_dir():
-                    sz = sum(f.stat().st_size for f in cdir.rglob("*") if f.is_file())
-                    results.append((str(cdir), sz))
-        return sorted(results, key=lambda t: t[1], reverse=True)
-
-    script = """
-import os, sys
-from pathlib import Path
-base = Path.home() / '.var' / 'app'
-if not base.is_dir():
-    sys.exit(0)
-for appdir in base.iterdir():
-    cdir = appdir / 'cache'
-    if cdir.is_dir():
-        size = 0
-        for f in cdir.rglob('*'):
-            try:
-                if f.is_file():
-                    size += f.stat().st_size
-            except Exception:
-                pass
-        print(f"{size} {cdir}")
-"""
-    code, out, _ = _run(_host_exec("python3", "-c", script))
-    results = []
-    if code == 0 and out.strip():
-        for ln in out.splitlines():
-            parts = ln.strip().split(None, 1)
-            if len(parts) == 2 and parts[0].isdigit():
-                results.append((parts[1], int(parts[0])))
-    return sorted(results, key=lambda t: t[1], reverse=True)
+    base = HOME / ".var" / "app"
+    return _sized_paths(_local_subdirs(base, "cache"), cancel)
 
 
-def _host_snap_cache_entries() -> list[tuple[str, int]]:
+def _host_snap_cache_entries(cancel: Gio.Cancellable | None = None) -> list[tuple[str, int]]:
     """Host ~/snap/*/common/.cache directories."""
-    base = Path.home() / "snap"
-    if not IS_FLATPAK:
-        results = []
-        if base.exists():
-            for appdir in base.iterdir():
-                cdir = appdir / "common" / ".cache"
-                if cdir.is_dir():
-                    sz = sum(f.stat().st_size for f in cdir.rglob("*") if f.is_file())
-                    results.append((str(cdir), sz))
-        return sorted(results, key=lambda t: t[1], reverse=True)
-
-    script = """
-import os, sys
-from pathlib import Path
-base = Path.home() / 'snap'
-if not base.is_dir():
-    sys.exit(0)
-for appdir in base.iterdir():
-    cdir = appdir / 'common' / '.cache'
-    if cdir.is_dir():
-        size = 0
-        for f in cdir.rglob('*'):
-            try:
-                if f.is_file():
-                    size += f.stat().st_size
-            except Exception:
-                pass
-        print(f"{size} {cdir}")
-"""
-    code, out, _ = _run(_host_exec("python3", "-c", script))
-    results = []
-    if code == 0 and out.strip():
-        for ln in out.splitlines():
-            parts = ln.strip().split(None, 1)
-            if len(parts) == 2 and parts[0].isdigit():
-                results.append((parts[1], int(parts[0])))
-    return sorted(results, key=lambda t: t[1], reverse=True)
+    base = HOME / "snap"
+    return _sized_paths(_local_subdirs(base, "common", ".cache"), cancel)
 
 
 def _host_rm_rf(path: Path) -> bool:
-    """Delete a host path via rm -rf (guarded by _is_allowed_host_target)."""
+    """Delete a host path (guarded by _is_allowed_host_target): rm -rf through flatpak-spawn
+    inside the sandbox, _rmtree_parallel() when we already run on the host."""
     if not _is_allowed_host_target(path):
         return False
+    _invalidate_size_cache(path)
+    if not IS_FLATPAK:
+        # The "host" is this process; no need to spawn rm for it
+        if os.path.isdir(path) and not os.path.islink(path):
+            _rmtree_parallel(path)
+        else:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                return False
+        return not os.path.lexists(path)
     code, _, _ = _run(_host_exec("rm", "-rf", str(path)))
     return code == 0
 
 
+def _last_line_fields(out: str) -> list[str]:
+    lines = out.strip().splitlines()
+    return lines[-1].split() if lines else []
+
 def _disk_usage_home_host() -> Tuple[int, int, int] | None:
     """Return (total, used, free) for $HOME from the host using multiple fallbacks."""
-    code, out, _ = _run(_host_exec("bash", "-lc",
-        'LANG=C df -B1 -P --output=size,used,avail "$HOME" | tail -n1'))
-    if code == 0 and out.strip():
-        parts = out.split()
-        if len(parts) >= 3:
-            try:
-                total, used, free = int(parts[0]), int(parts[1]), int(parts[2])
-                if total > 0:
-                    return total, used, free
-            except Exception:
-                pass
+    # Exec the tools directly: a login shell per probe sources the whole profile first
+    home = str(HOME)
+    code, out, _ = _run(_host_exec("env", "LANG=C", "df", "-B1", "--output=size,used,avail", home))
+    parts = _last_line_fields(out) if code == 0 else []
+    if len(parts) >= 3:
+        try:
+            total, used, free = int(parts[0]), int(parts[1]), int(parts[2])
+            if total > 0:
+                return total, used, free
+        except Exception:
+            pass
 
     # You never know when a utility might not be availible
-    code, out, _ = _run(_host_exec("bash", "-lc",
-        'LANG=C df -Pk --output=size,used,avail "$HOME" | tail -n1'))
-    if code == 0 and out.strip():
-        parts = out.split()
-        if len(parts) >= 3:
-            try:
-                total, used, free = (int(parts[0]) * 1024,
-                                     int(parts[1]) * 1024,
-                                     int(parts[2]) * 1024)
-                if total > 0:
-                    return total, used, free
-            except Exception:
-                pass
+    # POSIX format: Filesystem 1024-blocks Used Available Capacity Mounted-on
+    code, out, _ = _run(_host_exec("env", "LANG=C", "df", "-Pk", home))
+    parts = _last_line_fields(out)[1:4] if code == 0 else []
+    if len(parts) >= 3:
+        try:
+            total, used, free = (int(parts[0]) * 1024,
+                                 int(parts[1]) * 1024,
+                                 int(parts[2]) * 1024)
+            if total > 0:
+                return total, used, free
+        except Exception:
+            pass
 
     # Fallback to stat -f (block size * counts)
-    code, out, _ = _run(_host_exec("bash", "-lc",
-        'stat -f --format="%S %b %a" "$HOME"'))
-    if code == 0 and out.strip():
-        parts = out.split()
-        if len(parts) >= 3:
-            try:
-                bsize = int(parts[0]); blocks = int(parts[1]); avail = int(parts[2])
-                total = bsize * blocks
-                free = bsize * avail
-                used = max(0, total - free)
-                if total > 0:
-                    return total, used, free
-            except Exception:
-                pass
+    code, out, _ = _run(_host_exec("stat", "-f", "--format=%S %b %a", home))
+    parts = out.split() if code == 0 else []
+    if len(parts) >= 3:
+        try:
+            bsize = int(parts[0]); blocks = int(parts[1]); avail = int(parts[2])
+            total = bsize * blocks
+            free = bsize * avail
+            used = max(0, total - free)
+            if total > 0:
+                return total, used, free
+        except Exception:
+            pass
     return None
 
 def _gio_fs_usage(path: Path) -> Tuple[int, int, int] | None:
@@ -395,26 +479,43 @@ def _gio_fs_usage(path: Path) -> Tuple[int, int, int] | None:
         pass
     return None
 
-def disk_usage_home() -> Tuple[int, int, int]:
+# Last (measured_at, (total, used, free)); in the Flatpak each measurement is a host df spawn
+_DU_CACHE: tuple[float, Tuple[int, int, int]] | None = None
+_DU_CACHE_MAX_AGE = 5.0
+
+def disk_usage_home(max_age: float = _DU_CACHE_MAX_AGE) -> Tuple[int, int, int]:
+    """(total, used, free) for the home filesystem, reusing a measurement up to `max_age`
+    seconds old. Pass 0 for before/after comparisons around a removal."""
+    global _DU_CACHE
+    cached = _DU_CACHE
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < max_age:
+        return cached[1]
+    usage = _measure_disk_usage_home()
+    _DU_CACHE = (now, usage)
+    return usage
+
+def _measure_disk_usage_home() -> Tuple[int, int, int]:
     if IS_FLATPAK:
         host = _disk_usage_home_host()
         if host:
             return host
     # More fallbacks
-    p = Path.home()
+    p = HOME
     ans = _gio_fs_usage(p)
     if ans:
         return ans
     try:
-        total, used, free = shutil.disk_usage(str(p))
+        st = os.statvfs(str(p))
+        total = st.f_frsize * st.f_blocks
+        free = st.f_frsize * st.f_bavail
         if total > 0:
-            return int(total), int(used), int(free)
+            return total, max(0, total - free), free
     except Exception:
         pass
     return 1, 0, 1
 
-APP_ID_RE = re.compile(r"^[A-Za-z0-9_.-]+(?:\.[A-Za-z0-9_.-]+)+$")
-RUNTIME_LINE_RE = re.compile(r"^Runtime:\s*(.+?)\s*$", re.IGNORECASE)
+UNUSED_ROW_WS_RE = re.compile(r"[\s\u200b\u2000-\u200f]+")
 
 def _list_runtime_refs_via_flatpak(scope: str) -> list[str]:
     code, out, _ = _run(_host_exec("flatpak", "list", "--runtime", scope, "--columns=ref"))
@@ -440,43 +541,58 @@ def _host_installed_runtime_refs(scope: str) -> list[str]:
     # very defensive fallback scanning host FS
     roots: list[Path] = []
     if scope == "--user":
-        roots.append(Path.home() / ".local" / "share" / "flatpak" / "runtime")
+        roots.append(HOME / ".local" / "share" / "flatpak" / "runtime")
         vhome = Path("/var/home") / os.environ.get("USER", "")
         roots.append(vhome / ".local" / "share" / "flatpak" / "runtime")
     else:
         roots.append(Path("/var/lib/flatpak/runtime"))
+    def subdirs(path: str) -> list[os.DirEntry]:
+        try:
+            with os.scandir(path) as it:
+                return [e for e in it if e.is_dir()]
+        except OSError:
+            return []
+
+    # runtime/<name>/<arch>/<branch>: three fixed levels, listed straight off the dirents
     results: set[str] = set()
     for root in roots:
-        if not root.is_dir(): continue
-        try:
-            for name_dir in root.iterdir():
-                if not name_dir.is_dir(): continue
-                for arch_dir in name_dir.iterdir():
-                    if not arch_dir.is_dir(): continue
-                    for br_dir in arch_dir.iterdir():
-                        if not br_dir.is_dir(): continue
-                        name, arch, br = name_dir.name, arch_dir.name, br_dir.name
-                        results.add(f"runtime/{name}/{arch}/{br}")
-        except Exception:
-            pass
+        for name_dir in subdirs(str(root)):
+            for arch_dir in subdirs(name_dir.path):
+                for br_dir in subdirs(arch_dir.path):
+                    results.add(f"runtime/{name_dir.name}/{arch_dir.name}/{br_dir.name}")
     return sorted(results)
 
+_UNUSED_PROBE_MARK = "@@spruce-scope@@"
+_UNUSED_PROBE_SCRIPT = f"""
+probe() {{ printf 'n\\n' | LC_ALL=C flatpak remove --unused "$1" 2>&1; }}
+flatpak --default-arch 2>/dev/null
+# The two installations don't share a lock, so probe the system one in the background
+sys_out=$(mktemp 2>/dev/null) || sys_out=
+[ -n "$sys_out" ] && probe --system >"$sys_out" &
+echo "{_UNUSED_PROBE_MARK} --user"
+probe --user
+wait
+echo "{_UNUSED_PROBE_MARK} --system"
+if [ -n "$sys_out" ]; then cat "$sys_out"; rm -f "$sys_out"; else probe --system; fi
+"""
+
 def list_flatpak_unused_with_diag(win: Gtk.Widget) -> tuple[list[str], list[str], list[str]]:
     """
     Parse `flatpak remove --unused`
     """
     diag: list[str] = []
     removable_all, pinned_all, kept_all = [], [], []
+    pinned_seen: set[str] = set()
 
-    code, out, _ = _run(_host_exec("flatpak", "--default-arch"))
-    arch = out.strip() if code == 0 and out.strip() else "x86_64"
-
-    for scope in ("--user", "--system"):
-        code, out, err = _run(
-            _host_exec("bash", "-lc", f"LC_ALL=C printf 'n\\n' | flatpak remove --unused {scope}")
-        )
+    # One (host) shell for the arch and both scopes instead of three flatpak-spawn round-trips
+    _code, out, _ = _run(_host_exec("sh", "-c", _UNUSED_PROBE_SCRIPT))
+    sections = out.split(_UNUSED_PROBE_MARK)
+    arch = sections[0].strip() or "x86_64"
 
-        text = (out or err or "").strip()
+    for section in sections[1:]:
+        scope, _, text = section.partition("\n")
+        scope = scope.strip()
+        text = text.strip()
         diag.append(f"\n[{scope}] flatpak remove --unused output:\n{text}\n")
 
         in_removable = False
@@ -495,7 +611,9 @@ def list_flatpak_unused_with_diag(win: Gtk.Widget) -> tuple[list[str], list[str]
                 in_removable, in_pinned = True, False
                 continue
 
-            if re.match(r"^\d+\.", s):
+            # Rows look like "12. org.kde.Platform 6.9 r"; plain string tests, no regex per line
+            is_row = s[0].isdigit() and s.lstrip("0123456789").startswith(".")
+            if is_row:
                 in_removable, in_pinned = True, False
 
             if s.startswith(("Proceed", "Nothing")):
@@ -508,12 +626,13 @@ def list_flatpak_unused_with_diag(win: Gtk.Widget) -> tuple[list[str], list[str]
                     if not ref.startswith("runtime/"):
                         ref = f"runtime/{ref}"
                     pinned_all.append(ref)
+                    pinned_seen.add(ref)
                 continue
 
             # removable items
-            if in_removable and re.match(r"^\d+\.", s):
+            if in_removable and is_row:
                 # normalize all kinds of whitespace to single spaces
-                clean = re.sub(r"[\s\u200b\u2000-\u200f]+", " ", s)
+                clean = UNUSED_ROW_WS_RE.sub(" ", s)
                 # example: "1. org.kde.Platform 6.9 r"
                 parts = clean.split(" ")
                 parts = [p for p in parts if p and p != "."]
@@ -528,7 +647,7 @@ def list_flatpak_unused_with_diag(win: Gtk.Widget) -> tuple[list[str], list[str]
                 else:
                     continue
 
-                if ref in pinned_all:
+                if ref in pinned_seen:
                     kept_all.append(ref)
                     continue
 
@@ -552,61 +671,154 @@ def list_flatpak_unused_with_diag(win: Gtk.Widget) -> tuple[list[str], list[str]
     if SPRUCE_DEBUG:
         print("\n".join(diag), file=sys.stderr)
         print("\nParsed removables:", removable, file=sys.stderr)
-        try:
-            app = Gtk.Application.get_default()
-            w = app.props.active_window if app else None
-            if w and hasattr(w, "pkg_list"):
-                lbl: Gtk.Label = getattr(w, "pkg_list")
-                lbl.set_text(
-                    "\n".join(diag)
-                    + "\n\nParsed removables:\n"
-                    + "\n".join(removable)
-                )
-        except Exception:
-            pass
+        # May run on a worker thread, so only touch the label from the main loop
+        def show_diag():
+            try:
+                app = Gtk.Application.get_default()
+                w = app.props.active_window if app else None
+                if w and hasattr(w, "pkg_list"):
+                    lbl: Gtk.Label = getattr(w, "pkg_list")
+                    lbl.set_text(
+                        "\n".join(diag)
+                        + "\n\nParsed removables:\n"
+                        + "\n".join(removable)
+                    )
+            except Exception:
+                pass
+            return GLib.SOURCE_REMOVE
+        GLib.idle_add(show_diag)
 
     return removable, pinned, kept
 
-def _sandbox_first_level_cache_entries() -> list[tuple[Path, int]]:
+def _sandbox_first_level_cache_entries(cancel: Gio.Cancellable | None = None) -> list[tuple[Path, int]]:
     """First-level children of sandbox XDG_CACHE_HOME with sizes."""
     root = xdg_cache()
-    result: list[tuple[Path, int]] = []
     if not root.is_dir():
-        return result
-    for child in sorted(root.iterdir(), key=lambda p: p.name.lower()):
-        try:
-            size = 0
-            if child.is_dir():
-                for f in child.rglob('*'):
-                    try:
-                        if f.is_file():
-                            size += f.stat().st_size
-                    except Exception:
-                        pass
-            else:
-                size = child.stat().st_size
-            result.append((child, size))
-        except Exception:
-            pass
-    result.sort(key=lambda t: t[1], reverse=True)
-    return result
+        return []
+    # Outside Flatpak this is the host cache itself, which is already listed
+    if not IS_FLATPAK and _dir_key(root) in {_dir_key(r) for r in _host_cache_roots()}:
+        return []
+    try:
+        with os.scandir(root) as it:
+            children = [Path(e.path) for e in it]
+    except OSError:
+        return []
+    return _sized_paths(children, cancel)
 
 def _host_cache_paths_and_sizes() -> list[tuple[str, int]]:
     """Compatibility shim: host ~/.cache/* + ~/.var/app/*/cache."""
-    return _host_first_level_cache_entries() + _host_app_cache_entries()
+    groups = _host_sweep_entries(True, False)
+    return groups["first"] + groups["app"]
+
+# Every host source in one python3, so measuring or scanning from Flatpak costs a single
+# flatpak-spawn. argv: <sweep 0|1> <trash 0|1> <cache roots...>; prints "<tag> <size> <path>".
+# Each directory is listed on its own, so an unreadable one only loses its own entries.
+_HOST_SWEEP_SCRIPT = _HOST_DIR_SIZE + """
+import sys
+from concurrent.futures import ThreadPoolExecutor
+sweep, trash, roots = sys.argv[1] == "1", sys.argv[2] == "1", sys.argv[3:]
+def listing(path):
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+jobs = []
+if sweep:
+    seen = set()
+    for root in roots:
+        for entry in listing(root):
+            if entry.path not in seen:
+                seen.add(entry.path)
+                jobs.append(("first", entry.path))
+    for tag, base, parts in (("app", "~/.var/app", ("cache",)),
+                             ("snap", "~/snap", ("common", ".cache"))):
+        for entry in listing(os.path.expanduser(base)):
+            cdir = os.path.join(entry.path, *parts)
+            if os.path.isdir(cdir):
+                jobs.append((tag, cdir))
+if trash:
+    trash_files = os.path.expanduser('~/.local/share/Trash/files')
+    if os.path.isdir(trash_files):
+        jobs.append(("trash", trash_files))
+def one(job):
+    try:
+        return job[0], job[1], path_size(job[1])
+    except OSError:
+        return None
+with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+    for r in pool.map(one, jobs):
+        if r is not None:
+            print(f"{r[0]} {r[2]} {r[1]}")
+"""
+
+def _host_sweep_entries(sweep: bool, trash: bool,
+                        cancel: Gio.Cancellable | None = None) -> dict[str, list[tuple[str, int]]]:
+    """Host cache entries and the trash size, grouped as "first" (~/.cache/*), "app", "snap"
+    and "trash". From Flatpak this is one host round-trip; otherwise the local helpers run
+    side by side. A source that fails comes back empty without taking the others along,
+    and once `cancel` fires the groups are partial (or empty)."""
+    groups: dict[str, list[tuple[str, int]]] = {"first": [], "app": [], "snap": [], "trash": []}
+    if IS_FLATPAK:
+        roots = [str(r) for r in _host_cache_roots()] if sweep else []
+        code, out, _ = _run(_host_exec("python3", "-c", _HOST_SWEEP_SCRIPT,
+                                       "1" if sweep else "0", "1" if trash else "0", *roots),
+                             cancel=cancel)
+        if code == 0:
+            for ln in out.splitlines():
+                parts = ln.split(None, 2)
+                if len(parts) == 3 and parts[0] in groups and parts[1].isdigit():
+                    groups[parts[0]].append((parts[2], int(parts[1])))
+        return groups
+
+    sources = {}
+    if sweep:
+        sources.update(first=_host_first_level_cache_entries, app=_host_app_cache_entries,
+                       snap=_host_snap_cache_entries)
+    if trash:
+        sources["trash"] = lambda cancel: [(str(trash_dir() / "files"), get_trash_size(cancel))]
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(sources))) as pool:
+        for tag, fn in sources.items():
+            if cancel is not None and cancel.is_cancelled():
+                break
+            jobs[tag] = pool.submit(fn, cancel)
+    for tag, job in jobs.items():
+        try:
+            groups[tag] = job.result()
+        except Exception:
+            pass
+    return groups
 
 _ALLOWED_HOST_PREFIXES = [
-    Path.home() / ".cache",
-    Path.home() / ".var" / "app",
-    Path.home() / "snap",
-    Path.home() / ".local" / "share" / "Trash",
+    HOME / ".cache",
+    HOME / ".var" / "app",
+    HOME / "snap",
+    HOME / ".local" / "share" / "Trash",
 ]
 
+# Resolving walks every path component with readlink(); these never change, so do it once
+@functools.lru_cache(maxsize=1)
+def _resolved_host_prefixes() -> tuple[Path, ...]:
+    return tuple(pref.resolve() for pref in _ALLOWED_HOST_PREFIXES)
+
+_CRITICAL_PATHS = [Path("/"), Path("/home"), Path("/usr"), Path("/etc"),
+                   Path("/var"), Path("/bin"), Path("/sbin"), Path("/boot"),
+                   Path("/sys"), Path("/proc"), Path("/dev")]
+
+@functools.lru_cache(maxsize=1)
+def _resolved_critical_paths() -> frozenset[Path]:
+    return frozenset(critical.resolve() for critical in _CRITICAL_PATHS)
+
+@functools.lru_cache(maxsize=1)
+def _resolved_home() -> Path:
+    return HOME.resolve()
+
 def _is_allowed_host_target(p: Path) -> bool:
     try:
         rp = p.resolve()
-        for pref in _ALLOWED_HOST_PREFIXES:
-            if rp.is_relative_to(pref.resolve()):
+        for pref in _resolved_host_prefixes():
+            if rp.is_relative_to(pref):
                 return True
     except Exception:
         pass
@@ -620,19 +832,10 @@ def _is_safe_target(p: Path) -> bool:
         rp = p.resolve()
         # Block root and critical system directories
         # This might not seem neccesary right now, but I plan to add features that are very risky
-        critical_paths = [Path("/"), Path("/home"), Path("/usr"), Path("/etc"), 
-                         Path("/var"), Path("/bin"), Path("/sbin"), Path("/boot"),
-                         Path("/sys"), Path("/proc"), Path("/dev")]
-        
-        for critical in critical_paths:
-            try:
-                if rp == critical.resolve() or critical.resolve() == rp:
-                    return False
-            except Exception:
-                pass
-        
-        home = Path.home().resolve()
-        if not rp.is_relative_to(home):
+        if rp in _resolved_critical_paths():
+            return False
+
+        if not rp.is_relative_to(_resolved_home()):
             return False
             
         # Check against allowed prefixes
@@ -640,6 +843,81 @@ def _is_safe_target(p: Path) -> bool:
     except Exception:
         return False
 
+_HOST_EMPTY_TRASH = """
+import shutil
+from pathlib import Path
+trash = Path.home() / '.local' / 'share' / 'Trash'
+files_dir = trash / 'files'
+info_dir = trash / 'info'
+try:
+    if files_dir.exists():
+        shutil.rmtree(files_dir, ignore_errors=True)
+        files_dir.mkdir(exist_ok=True)
+    if info_dir.exists():
+        shutil.rmtree(info_dir, ignore_errors=True)
+        info_dir.mkdir(exist_ok=True)
+    print("success")
+except Exception as e:
+    print(f"error: {e}")
+"""
+
+def _rmtree_parallel(root: Path | str) -> None:
+    """shutil.rmtree(root, ignore_errors=True), with the top-level subtrees removed concurrently.
+    Unlinks are independent syscalls that release the GIL, so sibling trees overlap well."""
+    root = os.fspath(root)
+    if os.path.islink(root):
+        return  # rmtree refuses symlinks too; scandir would follow it
+    subdirs: list[str] = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    list(_WALK_POOL.map(functools.partial(shutil.rmtree, ignore_errors=True), subdirs))
+    shutil.rmtree(root, ignore_errors=True)
+
+def _remove_sweep_target(p: Path, on_host: bool) -> bool:
+    """Remove one sweep entry (the trash is emptied in place). Returns True if it was removed."""
+    _invalidate_size_cache(p)
+    is_trash = str(p).endswith(".local/share/Trash") or p.name == "Trash"
+
+    if on_host:
+        if is_trash:
+            code, out, _err = _run(_host_exec("python3", "-c", _HOST_EMPTY_TRASH))
+            return code == 0 and "success" in out
+        if not _is_allowed_host_target(p):
+            return False  # safety
+        return _host_rm_rf(p)
+
+    try:
+        if is_trash:
+            # Trash in sandbox
+            files_dir = p / "files"
+            info_dir = p / "info"
+            if files_dir.exists():
+                _rmtree_parallel(files_dir)
+                files_dir.mkdir(exist_ok=True)
+            if info_dir.exists():
+                _rmtree_parallel(info_dir)
+                info_dir.mkdir(exist_ok=True)
+            return True
+        if p.is_dir():
+            _rmtree_parallel(p)
+            return True
+        if p.exists():
+            p.unlink(missing_ok=True)
+            return True
+    except Exception:
+        pass
+    return False
+
 # UI
 
 @Gtk.Template(filename=_find_ui())
@@ -655,6 +933,20 @@ class SpruceWindow(Adw.ApplicationWindow):
     kept_btn: Gtk.Button = Gtk.Template.Child("kept_btn")
     header_bar: Adw.HeaderBar = Gtk.Template.Child("header_bar")
 
+    _CHART_HEX = {
+        "cache": "#e5a50a",
+        "trash": "#c01c28",
+        "other": "#2ea3d6",
+        "free": "#51d08a",
+        "bg_dark": "#3a3a3a",
+        "bg_light": "#d0d0d0",
+        "text": "#e6e6e6",
+        "legend_dark": "#e6e6e6",
+        "legend_light": "#1a1a1a",
+    }
+    _LEGEND_BOX = 10
+    _LEGEND_SPACING = 8
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -670,10 +962,17 @@ class SpruceWindow(Adw.ApplicationWindow):
         self.remove_btn.connect("clicked", self._on_remove_clicked)
         self.kept_btn.connect("clicked", self._on_show_kept_clicked)
         self.timeout_source = None
+        self._probe_running = False
+        # Set by anything that may change what's unused; tells a finishing probe to run again
+        self._unused_stale = True
 
         self._settings = Gio.Settings.new(APP_ID)
+        for key in ("show-cache", "show-trash"):
+            self._settings.connect(f"changed::{key}", self._on_chart_setting_changed)
         self._current_toast = None
         self._preferences_window = None
+        self._scan_cancel: Gio.Cancellable | None = None
+        self.connect("close-request", self._on_close_request)
 
         # Data for dialog
         self._last_hidden: list[str] = []
@@ -682,9 +981,40 @@ class SpruceWindow(Adw.ApplicationWindow):
         self.disk_data: Tuple[int, int, int] = (1, 0, 1)
         self.cache_size: int = 0
         self.trash_size: int = 0
+        self._measuring = False
+        self._measure_again = False
+
+        # Rendered chart, reused until size, data, settings or theme change
+        self._chart_key: tuple | None = None
+        self._chart_surface = None
+        self._geom_wh: tuple[int, int] | None = None
+        self._geom: tuple[float, float, float, float] = (0, 0, 0, 0)
+
+        # Chart fonts and colours, parsed once rather than on every render
+        self._font_pct = Pango.FontDescription("Cantarell Bold 40")
+        self._font_section = Pango.FontDescription("Cantarell Bold 11")
+        self._font_legend = Pango.FontDescription("Cantarell 10")
+        self._font_notice = Pango.FontDescription("Cantarell 14")
+        self._chart_layout: Pango.Layout | None = None
+        self._rgb: dict[str, tuple[float, float, float]] = {}
+        for name, hexcol in self._CHART_HEX.items():
+            rgba = Gdk.RGBA(); rgba.parse(hexcol)
+            self._rgb[name] = (rgba.red, rgba.green, rgba.blue)
         
         # Initial UI
         self._refresh_autoremove_label()
+
+        # Flatpak touches <installation>/.changed after every transaction; refresh on that
+        # instead of re-running the (expensive) unused-runtime probe on a schedule
+        self._flatpak_monitors: list[Gio.FileMonitor] = []
+        for stamp in (HOME / ".local" / "share" / "flatpak" / ".changed",
+                      Path("/var/lib/flatpak/.changed")):
+            try:
+                monitor = Gio.File.new_for_path(str(stamp)).monitor_file(Gio.FileMonitorFlags.NONE, None)
+            except GLib.Error:
+                continue
+            monitor.connect("changed", self._on_flatpak_changed)
+            self._flatpak_monitors.append(monitor)
         
         # Add about button to header bar
         about_btn = Gtk.Button()
@@ -700,8 +1030,8 @@ class SpruceWindow(Adw.ApplicationWindow):
         preferences_action.connect("activate", lambda *_: self._on_options_clicked(None))
         self.add_action(preferences_action)
         
-        # Defer data calculation until window is realized
-        GLib.idle_add(self._update_disk_data)
+        # The chart draws with placeholder figures until the first measurement lands
+        self._update_disk_data()
     
     def show_about(self, button):
         about = Adw.AboutWindow(
@@ -719,43 +1049,85 @@ class SpruceWindow(Adw.ApplicationWindow):
         about.present()
 
     def _update_disk_data(self):
-        """Update cached disk usage data, calculate cache size, and redraw chart."""
-        self.disk_data = disk_usage_home()
-        self._calculate_cache_size()
-        self._calculate_trash_size()
-        self.pie_chart.queue_draw()
-    
-    def _calculate_cache_size(self):
-        """Calculate total cache size across all sources."""
-        cache_size = 0
-        
+        """Re-measure disk usage, cache size and trash size in the background, then redraw chart."""
+        # Sizing walks every cache tree (or runs host scripts); keep it off the main loop, and
+        # fold requests that arrive mid-measurement into a single follow-up run
+        if self._measuring:
+            self._measure_again = True
+            return GLib.SOURCE_REMOVE
+        self._measuring = True
+        GLib.Thread.new("disk_data", self._measure_disk_data_in_thread)
+        return GLib.SOURCE_REMOVE
+
+    def _measure_disk_data_in_thread(self):
+        # Always report back, even if measuring fails: _apply_disk_data is what clears _measuring
+        result = None
         try:
-            for apath, sz in _host_first_level_cache_entries():
-                cache_size += sz
-            for apath, sz in _host_app_cache_entries():
-                cache_size += sz
-            for apath, sz in _host_snap_cache_entries():
-                cache_size += sz
-            for p, sz in _sandbox_first_level_cache_entries():
-                cache_size += sz
-        except Exception:
-            pass
-        
-        self.cache_size = cache_size
+            result = (disk_usage_home(), *self._calculate_cache_and_trash_size())
+        finally:
+            GLib.idle_add(self._apply_disk_data, result)
+        return None
+
+    def _apply_disk_data(self, result: Tuple[Tuple[int, int, int], int, int] | None):
+        self._measuring = False
+        if result is not None:
+            self.disk_data, self.cache_size, self.trash_size = result
+            self._chart_key = None
+            self.pie_chart.queue_draw()
+        if self._measure_again:
+            self._measure_again = False
+            self._update_disk_data()
+        return GLib.SOURCE_REMOVE
     
-    def _calculate_trash_size(self):
-        """Calculate trash bin size."""
+    def _calculate_cache_and_trash_size(self) -> tuple[int, int]:
+        """Total cache size across all sources, and the trash bin size."""
+        # One pass over the host sources (a single host spawn under Flatpak) covers both
+        groups = _host_sweep_entries(True, True)
+        cache_size = sum(sz for tag in ("first", "app", "snap") for _p, sz in groups[tag])
         try:
-            self.trash_size = get_trash_size()
+            cache_size += sum(sz for _p, sz in _sandbox_first_level_cache_entries())
         except Exception:
-            self.trash_size = 0
+            pass
+        return cache_size, sum(sz for _p, sz in groups["trash"])
+
+    def _on_chart_setting_changed(self, _settings, _key):
+        # Only which slices are shown changed; the sizes themselves are still valid
+        self.pie_chart.queue_draw()
+
+    def _on_flatpak_changed(self, *_args):
+        self._unused_stale = True
+        # A single transaction emits a burst of events; coalesce them into one refresh
+        if self.timeout_source:
+            GLib.source_remove(self.timeout_source)
+        self.timeout_source = GLib.timeout_add(500, self._refresh_autoremove_label)
 
     def _refresh_autoremove_label(self):
         if self.timeout_source:
             GLib.source_remove(self.timeout_source)
             self.timeout_source = None
 
+        # One probe at a time; _apply_autoremove_label re-runs it if it went stale meanwhile
+        if self._probe_running:
+            return GLib.SOURCE_REMOVE
+        self._probe_running = True
+        self._unused_stale = False
+
+        # flatpak remove --unused takes a while; keep it off the main loop
+        GLib.Thread.new("flatpak_unused", self._list_unused_in_thread)
+        return GLib.SOURCE_REMOVE
+
+    def _list_unused_in_thread(self):
         removable, pinned, kept = list_flatpak_unused_with_diag(self)
+        GLib.idle_add(self._apply_autoremove_label, removable, pinned, kept)
+        return None
+
+    def _apply_autoremove_label(self, removable: list[str], pinned: list[str], kept: list[str]):
+        self._probe_running = False
+        if self._unused_stale:
+            # Something changed while probing, so this result may already be out of date
+            self._refresh_autoremove_label()
+            return GLib.SOURCE_REMOVE
+
         combined = []
         seen = set()
         for lst in (pinned, kept):
@@ -854,23 +1226,20 @@ class SpruceWindow(Adw.ApplicationWindow):
             return count, had_error, error_msg
 
         removed = 0
-        initial_used_space = disk_usage_home()[1]
+        initial_used_space = disk_usage_home(max_age=0)[1]
         errors = []
-        try:
-            count, had_error, error_msg = _run_and_count("--user")
-            removed += count
-            if had_error:
-                errors.append(("user", error_msg))
-        except Exception as e:
-            errors.append(("user", str(e)))
-        try:
-            count, had_error, error_msg = _run_and_count("--system")
-            removed += count
-            if had_error:
-                errors.append(("system", error_msg))
-        except Exception as e:
-            errors.append(("system", str(e)))
-        final_used_space = disk_usage_home()[1]
+        # The user and system installations are locked separately, so uninstall from both at once
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            jobs = {name: pool.submit(_run_and_count, f"--{name}") for name in ("user", "system")}
+        for name, job in jobs.items():
+            try:
+                count, had_error, error_msg = job.result()
+                removed += count
+                if had_error:
+                    errors.append((name, error_msg))
+            except Exception as e:
+                errors.append((name, str(e)))
+        final_used_space = disk_usage_home(max_age=0)[1]
         freed_space = max(0, initial_used_space - final_used_space)
         freed_str = human_size(freed_space)
 
@@ -880,7 +1249,9 @@ class SpruceWindow(Adw.ApplicationWindow):
                 self._current_toast = None
 
             self._update_disk_data()
-            self._refresh_autoremove_label()
+            # Same debounce as the .changed monitors, so this and their event for the
+            # transaction we just ran end up as a single probe
+            self._on_flatpak_changed()
 
             app = Gtk.Application.get_default()
             win = app.props.active_window if app else None
@@ -913,22 +1284,50 @@ class SpruceWindow(Adw.ApplicationWindow):
         GLib.idle_add(_after)
         return None
 
+    def _on_close_request(self, *_args):
+        # Don't let a scan that's still running post its dialog to a closed window
+        if self._scan_cancel:
+            self._scan_cancel.cancel()
+        return False
+
     def _on_clear_clicked(self, _btn):
         if self._settings.get_boolean("sweep-enabled") or self._settings.get_boolean("trash-enabled"):
+            # A new scan supersedes one that is still running
+            if self._scan_cancel:
+                self._scan_cancel.cancel()
+            self._scan_cancel = cancel = Gio.Cancellable()
+            if self._current_toast:
+                self._current_toast.dismiss()
             self._current_toast = self._toast(_("Scanning cache directories..."))
-            GLib.Thread.new("cache_scanner", self._scan_cache_in_thread)
+            # Stays up until the scan ends; _finish_scan replaces or dismisses it
+            self._current_toast.set_timeout(0)
+            GLib.Thread.new("cache_scanner", self._scan_cache_in_thread, cancel)
         else:
-            initial_used_space = disk_usage_home()[1]
-            if self._perform_instant_clears():
-                final_used_space = disk_usage_home()[1]
+            # Deleting a big cache can take a while; keep it off the main loop
+            self.clear_btn.set_sensitive(False)
+            GLib.Thread.new("cache_clearer", self._instant_clear_in_thread)
+
+    def _instant_clear_in_thread(self):
+        initial_used_space = disk_usage_home(max_age=0)[1]
+        removed = self._perform_instant_clears()
+        final_used_space = disk_usage_home(max_age=0)[1] if removed else initial_used_space
+
+        def _after():
+            self.clear_btn.set_sensitive(True)
+            if removed:
                 freed_space = max(0, initial_used_space - final_used_space)
                 self._toast(_("Selected caches cleared, freeing {}").format(human_size(freed_space)))
                 self._update_disk_data()
+            return GLib.SOURCE_REMOVE
+
+        GLib.idle_add(_after)
+        return None
 
     def _perform_instant_clears(self):
         def rm_rf(p: Path) -> bool:
+            _invalidate_size_cache(p)
             try:
-                if p.is_dir(): shutil.rmtree(p, ignore_errors=True)
+                if p.is_dir(): _rmtree_parallel(p)
                 elif p.exists(): p.unlink(missing_ok=True)
                 return True
             except Exception:
@@ -988,27 +1387,13 @@ class SpruceWindow(Adw.ApplicationWindow):
         g3 = Adw.PreferencesGroup(title=_("Pie Chart Categories"))
         page.add(g3)
         
-        handler_ids = []
-        
         def add_chart_switch(title, subtitle, key):
             row = Adw.SwitchRow(title=title, subtitle=subtitle, active=self._settings.get_boolean(key))
-            def on_toggle(settings, changed_key):
-                if changed_key == key:
-                    self._update_disk_data()
-            handler_id = self._settings.connect("changed", on_toggle)
-            handler_ids.append(handler_id)
             self._settings.bind(key, row, "active", Gio.SettingsBindFlags.DEFAULT)
             g3.add(row)
         
         add_chart_switch(_("Show cache category"), _("Display cache usage in pie chart"), "show-cache")
         add_chart_switch(_("Show trash category"), _("Display trash usage in pie chart"), "show-trash")
-        
-        def cleanup_handlers(*_):
-            for handler_id in handler_ids:
-                self._settings.disconnect(handler_id)
-            handler_ids.clear()
-        
-        win.connect("destroy", cleanup_handlers)
 
         hb = Adw.HeaderBar()
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
@@ -1016,7 +1401,16 @@ class SpruceWindow(Adw.ApplicationWindow):
         win.set_content(box)
         win.present()
 
-    def _scan_cache_in_thread(self):
+    def _scan_cache_in_thread(self, cancel: Gio.Cancellable):
+        entries = None
+        try:
+            entries = self._collect_sweep_entries(cancel)
+        finally:
+            # The "Scanning..." toast has no timeout; always hand control back so it goes away
+            GLib.idle_add(self._finish_scan, entries, cancel)
+        return None
+
+    def _collect_sweep_entries(self, cancel: Gio.Cancellable) -> list[tuple[Path, int, bool, bool, str]] | None:
         """
         Build the sweep list with:
           - host ~/.cache/* (each first-level item)
@@ -1026,35 +1420,67 @@ class SpruceWindow(Adw.ApplicationWindow):
           - trash bin (if enabled)
         """
         entries: list[tuple[Path, int, bool, bool, str]] = []
-        
-        if self._settings.get_boolean("sweep-enabled"):
-            for apath, sz in _host_first_level_cache_entries():
+        sweep = self._settings.get_boolean("sweep-enabled")
+        trash = self._settings.get_boolean("trash-enabled")
+
+        # The host sources (one spawn under Flatpak) and the sandbox cache are independent.
+        # Both take `cancel` down to every directory they walk, so a superseded scan stops early.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if (sweep or trash) and not cancel.is_cancelled():
+                host = pool.submit(_host_sweep_entries, sweep, trash, cancel)
+            if sweep and not cancel.is_cancelled():
+                sandbox = pool.submit(_sandbox_first_level_cache_entries, cancel)
+        if cancel.is_cancelled():
+            return None
+
+        if sweep or trash:
+            groups = host.result()
+            first_entries, app_entries, snap_entries = groups["first"], groups["app"], groups["snap"]
+            trash_size = sum(sz for _p, sz in groups["trash"])
+
+        if sweep:
+            for apath, sz in first_entries:
                 p = Path(apath)
                 entries.append((p, sz, True, True, p.name))
 
-            for apath, sz in _host_app_cache_entries():
+            for apath, sz in app_entries:
                 p = Path(apath)
                 app_name = p.parent.name if p.name == "cache" else p.name
                 entries.append((p, sz, True, True, app_name))
 
-            for apath, sz in _host_snap_cache_entries():
+            for apath, sz in snap_entries:
                 p = Path(apath)
                 app_name = p.parent.parent.name if p.parts[-1] == ".cache" else p.name
                 entries.append((p, sz, True, True, f"{app_name}"))
 
-            for p, sz in _sandbox_first_level_cache_entries():
+            for p, sz in sandbox.result():
                 entries.append((p, sz, True, False, p.name))
                 
-        if self._settings.get_boolean("trash-enabled"):
-            trash_size = get_trash_size()
-            trash_path = Path.home() / ".local" / "share" / "Trash"
+        if trash:
+            trash_path = HOME / ".local" / "share" / "Trash"
             entries.append((trash_path, trash_size, True, True, "Trash bin"))
 
-        entries.sort(key=lambda t: t[1], reverse=True)
-        GLib.idle_add(self._show_sweep_dialog, entries)
-        return None
+        entries.sort(key=itemgetter(1), reverse=True)
+        return entries
 
-    def _show_sweep_dialog(self, entries: list[tuple[Path, int, bool, bool, str]]):
+    def _finish_scan(self, entries: list[tuple[Path, int, bool, bool, str]] | None,
+                     cancel: Gio.Cancellable):
+        # A superseding scan (or closing the window) already took care of the toast
+        if cancel.is_cancelled():
+            return GLib.SOURCE_REMOVE
+        if entries is not None:
+            self._show_sweep_dialog(entries, cancel)
+            return GLib.SOURCE_REMOVE
+        if self._current_toast:
+            self._current_toast.dismiss()
+            self._current_toast = None
+        self._toast(_("Could not scan cache directories"))
+        return GLib.SOURCE_REMOVE
+
+    def _show_sweep_dialog(self, entries: list[tuple[Path, int, bool, bool, str]],
+                           cancel: Gio.Cancellable | None = None):
+        if cancel is not None and cancel.is_cancelled():
+            return GLib.SOURCE_REMOVE
         if self._current_toast:
             self._current_toast.dismiss()
             self._current_toast = None
@@ -1108,90 +1534,36 @@ class SpruceWindow(Adw.ApplicationWindow):
         actions.append(rm_btn)
         v.append(actions)
 
-        def update_btn(*args):
-            rm_btn.set_sensitive(any(s.get_active() and s.get_sensitive() for s in toggles))
+        # Keep a running count so each toggle is O(1); rescanning every switch made
+        # "Select all" quadratic in the number of rows
+        n_selected = 0
+        def on_toggled(sw, _pspec):
+            nonlocal n_selected
+            if sw.get_sensitive():
+                n_selected += 1 if sw.get_active() else -1
+                rm_btn.set_sensitive(n_selected > 0)
         for s in toggles:
-            s.connect("notify::active", update_btn)        
-        update_btn()
+            s.connect("notify::active", on_toggled)
 
         def _set_all(active: bool):
             for s in toggles:
                 if s.get_sensitive():
                     s.set_active(active)
-            update_btn()
         sel_all.connect("toggled", lambda b: _set_all(b.get_active()))
 
         def do_rm(btn):
-            initial_used_space = disk_usage_home()[1]
-            removed = 0
-            host_targets: list[Path] = []
-            for sw, p, can_delete, on_host in zip(toggles, paths, deletable, on_host_flags):
-                if not can_delete or not sw.get_active():
-                    continue
-    
-                if not _is_safe_target(p):
-                    continue
-                is_trash = str(p).endswith(".local/share/Trash") or p.name == "Trash"
-
-                # Trash on host
-                if on_host:
-                    if is_trash:
-                        script = """
-import shutil
-from pathlib import Path
-trash = Path.home() / '.local' / 'share' / 'Trash'
-files_dir = trash / 'files'
-info_dir = trash / 'info'
-try:
-    if files_dir.exists():
-        shutil.rmtree(files_dir, ignore_errors=True)
-        files_dir.mkdir(exist_ok=True)
-    if info_dir.exists():
-        shutil.rmtree(info_dir, ignore_errors=True)
-        info_dir.mkdir(exist_ok=True)
-    print("success")
-except Exception as e:
-    print(f"error: {e}")
-"""
-                        code, out, _err = _run(_host_exec("python3", "-c", script))
-                        if code == 0 and "success" in out:
-                            removed += 1
-                    else:
-                        host_targets.append(p)
-                else:
-                    try:
-                        if is_trash:
-                            # Trash in sandbox
-                            files_dir = p / "files"
-                            info_dir = p / "info"
-                            if files_dir.exists():
-                                shutil.rmtree(files_dir, ignore_errors=True)
-                                files_dir.mkdir(exist_ok=True)
-                            if info_dir.exists():
-                                shutil.rmtree(info_dir, ignore_errors=True)
-                                info_dir.mkdir(exist_ok=True)
-                            removed += 1
-                        elif p.is_dir():
-                            shutil.rmtree(p, ignore_errors=True)
-                            removed += 1
-                        elif p.exists():
-                            p.unlink(missing_ok=True)
-                            removed += 1
-                    except Exception:
-                        pass
-            if host_targets:
-                for t in host_targets:
-                    if not _is_allowed_host_target(t):
-                        continue  # safety
-                    if _host_rm_rf(t):
-                        removed += 1
-
-            if removed:
-                final_used_space = disk_usage_home()[1]
-                freed_space = max(0, initial_used_space - final_used_space)
-                self._toast(_("Removed {} item(s), freeing {}").format(removed, human_size(freed_space)))
-                self._update_disk_data()
+            targets = [(p, on_host)
+                       for sw, p, can_delete, on_host in zip(toggles, paths, deletable, on_host_flags)
+                       if can_delete and sw.get_active() and _is_safe_target(p)]
             dlg.close()
+            if not targets:
+                return
+            if self._current_toast:
+                self._current_toast.dismiss()
+            self._current_toast = toast = self._toast(_("Removing {} item(s)...").format(len(targets)))
+            toast.set_timeout(0)
+            # Big caches take a while to delete; keep it off the main loop
+            GLib.Thread.new("cache_remover", self._remove_sweep_in_thread, targets, toast)
 
         rm_btn.connect("clicked", do_rm)
         actions.set_halign(Gtk.Align.START)
@@ -1201,15 +1573,59 @@ except Exception as e:
         body.append(v)
         dlg.set_child(body)
 
+    def _remove_sweep_in_thread(self, targets: list[tuple[Path, bool]], toast: Adw.Toast):
+        initial_used_space = disk_usage_home(max_age=0)[1]
+        removed = 0
+        # Selected trees are independent, so their unlinks (or host rm -rf spawns) can overlap
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as pool:
+            jobs = [pool.submit(_remove_sweep_target, p, on_host) for p, on_host in targets]
+            for done, job in enumerate(as_completed(jobs), 1):
+                removed += job.result()
+                if done < len(jobs):
+                    GLib.idle_add(self._show_remove_progress, toast, done, len(jobs))
+        final_used_space = disk_usage_home(max_age=0)[1] if removed else initial_used_space
+
+        def _after():
+            toast.dismiss()
+            if self._current_toast is toast:
+                self._current_toast = None
+            if removed:
+                freed_space = max(0, initial_used_space - final_used_space)
+                self._toast(_("Removed {} item(s), freeing {}").format(removed, human_size(freed_space)))
+                self._update_disk_data()
+            return GLib.SOURCE_REMOVE
+
+        GLib.idle_add(_after)
+        return None
+
+    def _show_remove_progress(self, toast: Adw.Toast, done: int, total: int):
+        # Only ever this removal's own toast; a scan started meanwhile has its own
+        toast.set_title(_("Removing {} item(s)... ({}/{})").format(total, done, total))
+        return GLib.SOURCE_REMOVE
+
     def _draw_chart(self, _area, cr, w: int, h: int, _data):
         if cairo is None:
-            layout = PangoCairo.create_layout(cr)
-            layout.set_text(_("Cairo not available; chart disabled"))
-            layout.set_font_description(Pango.FontDescription("Cantarell 14"))
+            layout = self._chart_text(cr, _("Cairo not available; chart disabled"), self._font_notice)
             cr.set_source_rgba(1, 1, 1, 0.8)
             tw, th = layout.get_pixel_size()
             cr.move_to((w - tw)/2, (h - th)/2); PangoCairo.show_layout(cr, layout); return
 
+        if w <= 0 or h <= 0:
+            return
+        scale = self.pie_chart.get_scale_factor()
+        key = (w, h, scale, self.disk_data, self.cache_size, self.trash_size,
+               self._settings.get_boolean("show-cache"), self._settings.get_boolean("show-trash"),
+               Adw.StyleManager.get_default().get_dark())
+        if key != self._chart_key or self._chart_surface is None:
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w * scale, h * scale)
+            surface.set_device_scale(scale, scale)
+            self._render_chart(cairo.Context(surface), w, h)
+            self._chart_surface = surface
+            self._chart_key = key
+        cr.set_source_surface(self._chart_surface, 0, 0)
+        cr.paint()
+
+    def _render_chart(self, cr, w: int, h: int):
         total, used, free = self.disk_data
         cache_size = self.cache_size if self._settings.get_boolean("show-cache") else 0
         trash_size = self.trash_size if self._settings.get_boolean("show-trash") else 0
@@ -1218,120 +1634,54 @@ except Exception as e:
         style_manager = Adw.StyleManager.get_default()
         is_dark = style_manager.get_dark()
         
-        col_cache = "#e5a50a"
-        col_trash = "#c01c28"
-        col_other = "#2ea3d6"
-        col_free = "#51d08a"
-        col_bg = "#3a3a3a" if is_dark else "#d0d0d0"
-        col_text = "#e6e6e6"
-        col_legend = "#e6e6e6" if is_dark else "#1a1a1a"
-
-        def set_hex(hexcol: str, a=1.0):
-            rgba = Gdk.RGBA(); rgba.parse(hexcol)
-            cr.set_source_rgba(rgba.red, rgba.green, rgba.blue, a)
-
-        chart_h = h - 90
-        pad = 24; size = max(0, min(w, chart_h) - pad*2); r = size/2; cx, cy = pad + r, pad + r
-        set_hex(col_bg); cr.arc(cx, cy, r, 0, 2*math.pi); cr.fill()
+        rgb = self._rgb
+        col_cache = rgb["cache"]
+        col_trash = rgb["trash"]
+        col_other = rgb["other"]
+        col_free = rgb["free"]
+        col_bg = rgb["bg_dark"] if is_dark else rgb["bg_light"]
+        col_text = rgb["text"]
+        col_legend = rgb["legend_dark"] if is_dark else rgb["legend_light"]
+
+        def set_rgb(col: tuple[float, float, float], a=1.0):
+            cr.set_source_rgba(col[0], col[1], col[2], a)
+
+        chart_h, r, cx, cy = self._chart_geometry(w, h)
+        set_rgb(col_bg); cr.arc(cx, cy, r, 0, 2*math.pi); cr.fill()
+
+        # (colour, angle, label) per slice, computed once for both the fills and the labels
+        slices = []
+        if total > 0:
+            for col, size, label in ((col_cache, cache_size, _("Cache\n{}")),
+                                     (col_trash, trash_size, _("Trash\n{}")),
+                                     (col_other, other_used, _("Other\n{}")),
+                                     (col_free, free, _("Free\n{}"))):
+                slices.append((col, (size / total) * 2 * math.pi, label.format(human_size(size))))
 
         start = -math.pi/2
-        
-        if total > 0:
-            cache_ang = (cache_size / total) * 2 * math.pi
-            trash_ang = (trash_size / total) * 2 * math.pi
-            other_ang = (other_used / total) * 2 * math.pi
-            free_ang = (free / total) * 2 * math.pi
-            
-            current = start
-            
-            if cache_ang > 0.01:
-                set_hex(col_cache)
-                cr.move_to(cx, cy)
-                cr.arc(cx, cy, r, current, current + cache_ang)
-                cr.close_path()
-                cr.fill()
-                current += cache_ang
-            
-            if trash_ang > 0.01:
-                set_hex(col_trash)
-                cr.move_to(cx, cy)
-                cr.arc(cx, cy, r, current, current + trash_ang)
-                cr.close_path()
-                cr.fill()
-                current += trash_ang
-            
-            if other_ang > 0.01:
-                set_hex(col_other)
-                cr.move_to(cx, cy)
-                cr.arc(cx, cy, r, current, current + other_ang)
-                cr.close_path()
-                cr.fill()
-                current += other_ang
-            
-            if free_ang > 0.01:
-                set_hex(col_free)
+        current = start
+        for col, ang, _label in slices:
+            if ang > 0.01:
+                set_rgb(col)
                 cr.move_to(cx, cy)
-                cr.arc(cx, cy, r, current, current + free_ang)
+                cr.arc(cx, cy, r, current, current + ang)
                 cr.close_path()
                 cr.fill()
+                current += ang
 
         pct = int(round((used / total) * 100)) if total > 0 else 0
-        layout = PangoCairo.create_layout(cr); layout.set_text(f"{pct}%")
-        layout.set_font_description(Pango.FontDescription("Cantarell Bold 40"))
-        tw, th = layout.get_pixel_size(); set_hex(col_text, 0.95)
+        layout = self._chart_text(cr, f"{pct}%", self._font_pct)
+        tw, th = layout.get_pixel_size(); set_rgb(col_text, 0.95)
         cr.move_to(cx - tw/2, cy - th/2); PangoCairo.show_layout(cr, layout)
 
-        def section_label(a_mid, txt, distance):
-            lx = cx + math.cos(a_mid) * distance
-            ly = cy + math.sin(a_mid) * distance
-            layout = PangoCairo.create_layout(cr); layout.set_text(txt)
-            layout.set_font_description(Pango.FontDescription("Cantarell Bold 11"))
-            tw, th = layout.get_pixel_size()
-            cr.set_source_rgba(1, 1, 1, 0.95)
-            cr.move_to(lx - tw/2, ly - th/2); PangoCairo.show_layout(cr, layout)
-
-        if total > 0:
-            current = start
-            cache_ang = (cache_size / total) * 2 * math.pi
-            trash_ang = (trash_size / total) * 2 * math.pi
-            other_ang = (other_used / total) * 2 * math.pi
-            
-            if cache_ang > 0.15:
-                cache_mid = current + cache_ang/2
-                section_label(cache_mid, _("Cache\n{}").format(human_size(cache_size)), r * 0.7)
-            current += cache_ang
-            
-            if trash_ang > 0.15:
-                trash_mid = current + trash_ang/2
-                section_label(trash_mid, _("Trash\n{}").format(human_size(trash_size)), r * 0.7)
-            current += trash_ang
-            
-            if other_ang > 0.15:
-                other_mid = current + other_ang/2
-                section_label(other_mid, _("Other\n{}").format(human_size(other_used)), r * 0.7)
-            current += other_ang
-            
-            free_ang = (free / total) * 2 * math.pi
-            if free_ang > 0.15:
-                free_mid = current + free_ang/2
-                section_label(free_mid, _("Free\n{}").format(human_size(free)), r * 0.7)
+        current = start
+        for _col, ang, label in slices:
+            if ang > 0.15:
+                self._chart_section_label(cr, cx, cy, current + ang/2, r * 0.7, label)
+            current += ang
 
         legend_y = chart_h + 15
         legend_x = 20
-        box_size = 10
-        spacing = 8
-        
-        def draw_legend_item(x, y, color, text):
-            set_hex(color)
-            cr.rectangle(x, y, box_size, box_size)
-            cr.fill()
-            
-            layout = PangoCairo.create_layout(cr)
-            layout.set_text(text)
-            layout.set_font_description(Pango.FontDescription("Cantarell 10"))
-            set_hex(col_legend, 0.9)
-            cr.move_to(x + box_size + 6, y - 2)
-            PangoCairo.show_layout(cr, layout)
         
         legend_items = []
         if self._settings.get_boolean("show-cache"):
@@ -1342,7 +1692,47 @@ except Exception as e:
         legend_items.append((col_free, _("Free: {}").format(human_size(free))))
         
         for i, (color, text) in enumerate(legend_items):
-            draw_legend_item(legend_x, legend_y + i * (box_size + spacing), color, text)
+            self._chart_legend_item(cr, legend_x, legend_y + i * (self._LEGEND_BOX + self._LEGEND_SPACING),
+                                    color, col_legend, text)
+
+    def _chart_geometry(self, w: int, h: int) -> tuple[float, float, float, float]:
+        """(chart_h, r, cx, cy) for a widget size; only changes when the widget is resized."""
+        if self._geom_wh != (w, h):
+            chart_h = h - 90
+            pad = 24; size = max(0, min(w, chart_h) - pad*2); r = size/2
+            self._geom = (chart_h, r, pad + r, pad + r)
+            self._geom_wh = (w, h)
+        return self._geom
+
+    def _chart_text(self, cr, text: str, font: Pango.FontDescription) -> Pango.Layout:
+        """The window's one chart layout, retargeted at `cr` and set to `text` in `font`."""
+        if self._chart_layout is None:
+            self._chart_layout = PangoCairo.create_layout(cr)
+        else:
+            PangoCairo.update_layout(cr, self._chart_layout)
+        self._chart_layout.set_font_description(font)
+        self._chart_layout.set_text(text, -1)
+        return self._chart_layout
+
+    def _chart_section_label(self, cr, cx: float, cy: float, a_mid: float, distance: float, txt: str):
+        x = cx + math.cos(a_mid) * distance
+        y = cy + math.sin(a_mid) * distance
+        layout = self._chart_text(cr, txt, self._font_section)
+        tw, th = layout.get_pixel_size()
+        cr.set_source_rgba(1, 1, 1, 0.95)
+        cr.move_to(x - tw/2, y - th/2); PangoCairo.show_layout(cr, layout)
+
+    def _chart_legend_item(self, cr, x: float, y: float, color: tuple[float, float, float],
+                           text_color: tuple[float, float, float], text: str):
+        box = self._LEGEND_BOX
+        cr.set_source_rgba(*color, 1.0)
+        cr.rectangle(x, y, box, box)
+        cr.fill()
+
+        layout = self._chart_text(cr, text, self._font_legend)
+        cr.set_source_rgba(*text_color, 0.9)
+        cr.move_to(x + box + 6, y - 2)
+        PangoCairo.show_layout(cr, layout)
 
     def _toast(self, text: str):
         toast = Adw.Toast.new(text)